@@ -30,11 +30,10 @@ from nputop.version import __version__
 __all__ = [*api.__all__, 'select_devices']
 
 # Add submodules to the top-level namespace
-for submodule in (collector, device, host, process, utils):
-    sys.modules[f'{__name__}.{submodule.__name__.rpartition(".")[-1]}'] = submodule
+sys.modules.update(api._SUBMODULES)
 
 # Remove the nputop.select module from sys.modules
 # Required for `python -m nputop.select` to work properly
-sys.modules.pop(f'{__name__}.select', None)
+sys.modules.pop('nputop.select', None)
 
 del sys
@@ -18,7 +18,9 @@
 
 """The core APIs of nputop."""
 
-from nputop.api import collector, device, host, process, utils
+import atexit
+
+from nputop.api import collector, device, host, libascend, process, utils
 from nputop.api.collector import ResourceMetricCollector, collect_in_background, take_snapshots
 from nputop.api.device import (
     CudaDevice,
@@ -54,6 +56,20 @@ from nputop.api.utils import (  # explicitly export these to appease mypy
 )
 
 
+# Submodules re-exported as top-level aliases (``nputop.device`` -> ``nputop.api.device``)
+_SUBMODULES = (
+    ('nputop.collector', collector),
+    ('nputop.device', device),
+    ('nputop.host', host),
+    ('nputop.process', process),
+    ('nputop.utils', utils),
+)
+
+# Initialize the Ascend backend once per process instead of on every query
+libascend.ascendInit()
+atexit.register(libascend.ascendShutdown)
+
+
 __all__ = [
     # nputop.api.device
     'Device',
@@ -26,7 +26,7 @@ import math
 import os
 import threading
 import time
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from typing import Callable, ClassVar, Generator, Iterable, NamedTuple, TypeVar
 from weakref import WeakSet
 
@@ -51,7 +51,7 @@ _T = TypeVar('_T')
 
 
 def _unique(iterable: Iterable[_T]) -> list[_T]:
-    return list(OrderedDict.fromkeys(iterable).keys())
+    return list(dict.fromkeys(iterable))
 
 
 # pylint: disable-next=too-many-branches
@@ -181,7 +181,7 @@ def take_snapshots(
             itertools.chain.from_iterable(device.processes().values() for device in leaf_devices),
         )
 
-    devices = [device.as_snapshot() for device in devices]  # type: ignore[union-attr]
+    devices = Device.take_snapshots(devices)  # type: ignore[arg-type]
     npu_processes = NpuProcess.take_snapshots(npu_processes, failsafe=True)
 
     return SnapshotResult(devices, npu_processes)
@@ -710,7 +710,7 @@ class ResourceMetricCollector:  # pylint: disable=too-many-instance-attributes
         timestamp = timer()
         epoch_timestamp = time.time()
         metrics = {}
-        device_snapshots = [device.as_snapshot() for device in self.all_devices]
+        device_snapshots = Device.take_snapshots(self.all_devices)
         npu_process_snapshots = NpuProcess.take_snapshots(npu_processes, failsafe=True)
 
         metrics.update(
@@ -24,7 +24,9 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import os
+import re
 import threading
 from typing import Any, Generator, Iterable, NamedTuple
 
@@ -35,10 +37,29 @@ from nputop.api.utils import (
     NaType,
     Snapshot,
     bytes2human,
+    memoize_static,
     memoize_when_activated,
 )
 
 
+# npu-smi 以 MB 为单位上报显存，取值天然按 MiB 量化且变化缓慢，格式化结果可直接复用
+_bytes2human = functools.lru_cache(maxsize=4096)(bytes2human)
+
+# 驱动 / CANN 版本在进程生命周期内不会变化，查询成功后缓存
+_SYSTEM_VERSIONS: dict[str, str] = {}
+
+
+def _query_system_version(func: str) -> str | NaType:
+    try:
+        return _SYSTEM_VERSIONS[func]
+    except KeyError:
+        pass
+    version = libnvml.nvmlQuery(func, default=NA)
+    if version and version != NA:
+        _SYSTEM_VERSIONS[func] = version
+    return version
+
+
 # ────────────────────────────────────────────────────────────────
 # NamedTuple 定义
 # ────────────────────────────────────────────────────────────────
@@ -59,38 +80,47 @@ class UtilizationRates(NamedTuple):
         return self.npu
 
 
+# 查询失败时共用同一个全 N/A 实例（NamedTuple 不可变）
+_NA_UTILIZATION_RATES = UtilizationRates(npu=NA, memory=NA, encoder=NA, decoder=NA)
+# npu-smi 查询失败时 _dynamic_info() 的返回值；内存保持 MemoryInfo 形状，memory_used() 等不会因 NA 崩溃
+_NA_DYNAMIC_INFO = (NA, NA, NA, libnvml.MemInfo(0, 0, 0))
+
+
 # ────────────────────────────────────────────────────────────────
 # Ascend NPU 设备类
 # ────────────────────────────────────────────────────────────────
 class Device:  # pylint: disable=too-many-instance-attributes
     NPU_PROCESS_CLASS = NpuProcess
 
+    __slots__ = ('_index', '_lock', '_uuid', '_hash', '_static_cache', '_cache', '__weakref__')
+
     def __init__(self, index: int):
         self._index = index
-        self._lock: threading.RLock = threading.RLock()
-        self._name: str | None = None
-        self._uuid: str | None = None
-        self._memory_total_human: str | NaType = NA
+        self._lock: threading.RLock = threading.RLock()  # oneshot() 可嵌套（如 oneshot 内再 as_snapshot）
+        # Ascend 没 UUID，用伪造方便去重
+        self._uuid: str = f"ASCEND-{index:02d}"
+        self._hash: int = hash((index, self._uuid))
+        self._static_cache: dict[str, Any] = {}
 
     # ------------------------------------------------------------
     # 列表/构造
     # ------------------------------------------------------------
+    @classmethod
+    def all(cls) -> list[Device]:
+        """按逻辑 index 顺序返回全部 NPU（不做 index 校验）。"""
+        return [cls(idx) for idx in range(cls.count())]
+
     @classmethod
     def from_indices(
         cls,
         indices: int | Iterable[int] | None = None,
     ) -> list[Device]:
+        valid = range(cls.count())  # 只查一次设备数，越界 index 直接丢弃
         if indices is None:
-            indices = range(cls.count())
-        elif isinstance(indices, int):
-            indices = [indices]
-        devices: list[Device] = []
-        for idx in indices:  # type: ignore[iteration]
-            try:
-                devices.append(cls(idx))  # type: ignore[arg-type]
-            except Exception:
-                continue
-        return devices
+            return [cls(idx) for idx in valid]
+        if isinstance(indices, int):
+            indices = (indices,)
+        return [cls(idx) for idx in indices if idx in valid]  # type: ignore[union-attr]
 
     # ------------------------------------------------------------
     # 标识
@@ -103,19 +133,16 @@ class Device:  # pylint: disable=too-many-instance-attributes
     def physical_index(self) -> int:
         return self._index
 
+    @memoize_static
     def name(self) -> str | NaType:
-        if self._name is None:
-            self._name = libnvml.nvmlQuery("ascendDeviceGetName", self.index)
-        return self._name or NA
+        return libnvml.nvmlQuery("ascendDeviceGetName", self.index) or NA
 
     def uuid(self) -> str | NaType:
-        if self._uuid is None:
-            # Ascend 没 UUID，用伪造方便去重
-            self._uuid = f"ASCEND-{self.index:02d}"
         return self._uuid
 
+    @memoize_static
     def bus_id(self) -> str | NaType:
-        return NA
+        return libnvml.nvmlQuery("ascendDeviceGetBusId", self.index)
 
     # ------------------------------------------------------------
     # 设备数量
@@ -129,12 +156,12 @@ class Device:  # pylint: disable=too-many-instance-attributes
     # ------------------------------------------------------------
     @staticmethod
     def driver_version() -> str | NaType:
-        return libnvml.nvmlQuery("ascendSystemGetDriverVersion", default=NA)
+        return _query_system_version("ascendSystemGetDriverVersion")
 
     @staticmethod
     def cuda_driver_version() -> str | NaType:
-        return libnvml.nvmlQuery("ascendSystemGetCANNVersion", default=NA)
-    
+        return _query_system_version("ascendSystemGetCANNVersion")
+
     max_cuda_version = driver_version
 
     # ------------------------------------------------------------
@@ -179,27 +206,35 @@ class Device:  # pylint: disable=too-many-instance-attributes
     # 温度 & 功耗
     # ------------------------------------------------------------
     def temperature(self) -> int | NaType:
-        return libnvml.nvmlQuery("ascendDeviceGetTemperature", self.index)
+        return self._dynamic_info()[0]
 
     def power_usage(self) -> int | NaType:
-        return libnvml.nvmlQuery("ascendDeviceGetPowerUsage", self.index)
+        return self._dynamic_info()[1]
 
+    @memoize_static
     def power_limit(self) -> int | NaType:
         return libnvml.nvmlQuery("ascendDeviceGetPowerLimit", self.index)
 
     def power_status(self) -> str | NaType:
-        pu = self.power_usage()
-        li = self.power_limit()
-        li = f"{float(li)}W" if isinstance(li, int) else "N/A"
-        return f"{pu/1000 if isinstance(pu, (int,float)) else pu}W / {li}"
+        pu = self.power_usage()  # mW
+        li = self.power_limit()  # W
+        pu_str = f"{pu * 1e-3:.1f}" if type(pu) in (int, float) else pu
+        li_str = f"{li:.1f}W" if type(li) is int else NA
+        return f"{pu_str}W / {li_str}"
 
     # ------------------------------------------------------------
     # 内存
     # ------------------------------------------------------------
+    @memoize_when_activated
+    def _dynamic_info(self) -> tuple[Any, Any, tuple | NaType, MemoryInfo]:
+        # (temp, power, util, mem)：都来自同一份 npu-smi 输出，oneshot 内只查一次
+        return libnvml.nvmlQuery("ascendDeviceGetAll", self.index, default=_NA_DYNAMIC_INFO)
+
     @memoize_when_activated
     def memory_info(self) -> MemoryInfo:
-        return libnvml.nvmlQuery("ascendDeviceGetMemoryInfo", self.index)
+        return self._dynamic_info()[3]
 
+    @memoize_static
     def memory_total(self) -> int | NaType:
         return self.memory_info().total
 
@@ -210,15 +245,20 @@ class Device:  # pylint: disable=too-many-instance-attributes
         return self.memory_info().free
 
     def memory_total_human(self) -> str | NaType:
-        if self._memory_total_human == NA:
-            self._memory_total_human = bytes2human(self.memory_total())
-        return self._memory_total_human
+        # 不单独做 memoize_static：失败时 total=0 会格式化成真值 '0B'，被永久缓存
+        return _bytes2human(self.memory_total())
+
+    @memoize_when_activated
+    def memory_info_human(self) -> tuple[str | NaType, str | NaType, str | NaType]:
+        # (total, free, used)，一次 oneshot 内只格式化一遍，memory_usage 等复用
+        info = self.memory_info()
+        return self.memory_total_human(), _bytes2human(info.free), _bytes2human(info.used)
 
     def memory_used_human(self) -> str | NaType:
-        return bytes2human(self.memory_used())
+        return self.memory_info_human()[2]
 
     def memory_free_human(self) -> str | NaType:
-        return bytes2human(self.memory_free())
+        return self.memory_info_human()[1]
 
     def memory_percent(self) -> float | NaType:
         info = self.memory_info()
@@ -227,17 +267,18 @@ class Device:  # pylint: disable=too-many-instance-attributes
         return NA
 
     def memory_usage(self) -> str:
-        return f"{self.memory_used_human()} / {self.memory_total_human()}"
+        total, _, used = self.memory_info_human()
+        return f"{used} / {total}"
 
     # ------------------------------------------------------------
     # 利用率
     # ------------------------------------------------------------
     @memoize_when_activated
     def utilization_rates(self) -> UtilizationRates:
-        util = libnvml.nvmlQuery("ascendDeviceGetUtilizationRates", self.index)
+        util = self._dynamic_info()[2]
         if isinstance(util, (tuple, list)) and len(util) >= 2:
             return UtilizationRates(npu=util[0], memory=util[1], encoder=NA, decoder=NA)
-        return UtilizationRates(npu=NA, memory=NA, encoder=NA, decoder=NA)
+        return _NA_UTILIZATION_RATES
 
     def npu_utilization(self) -> int | NaType:
         return self.utilization_rates().npu
@@ -257,34 +298,38 @@ class Device:  # pylint: disable=too-many-instance-attributes
     # 进程列表
     # ------------------------------------------------------------
     def processes(self) -> dict[int, NpuProcess]:
-        procs: dict[int, NpuProcess] = {}
-        for p in libnvml.nvmlQuery("ascendDeviceGetProcessInfo", self.index, default=()):
-            proc = self.NPU_PROCESS_CLASS(pid=p.pid, device=self, npu_memory=p.usedNpuMemory)
-            proc.set_npu_utilization(NA, NA, NA, NA)
-            procs[p.pid] = proc
-        return procs
+        cls = self.NPU_PROCESS_CLASS
+        na_utilization = (NA, NA, NA, NA)  # npu-smi 不提供进程级利用率
+        return {
+            p.pid: cls(pid=p.pid, device=self, npu_memory=p.usedNpuMemory, npu_utilization=na_utilization)
+            for p in libnvml.nvmlQuery("ascendDeviceGetProcessInfo", self.index, default=())
+        }
 
     # ------------------------------------------------------------
     # oneshot 缓存
     # ------------------------------------------------------------
     @contextlib.contextmanager
     def oneshot(self) -> Generator[None, None, None]:
+        """Cache the dynamic queries (memory / utilization) for the duration of the block.
+
+        The context manager is reentrant: a nested :meth:`oneshot` (or :meth:`as_snapshot`) on the
+        same device reuses the outer cache.
+        """
         with self._lock:
             if hasattr(self, "_cache"):
                 yield
             else:
+                # 所有 memoize_when_activated 方法共用同一个 _cache，一次建立、一次清除
+                self._cache = {}
                 try:
-                    self.memory_info.cache_activate(self)        # type: ignore[attr-defined]
-                    self.utilization_rates.cache_activate(self)  # type: ignore[attr-defined]
                     yield
                 finally:
-                    self.memory_info.cache_deactivate(self)      # type: ignore[attr-defined]
-                    self.utilization_rates.cache_deactivate(self)  # type: ignore[attr-defined]
+                    del self._cache
 
     # ------------------------------------------------------------
     # 快照字段：与原 NVML 版保持一致
     # ------------------------------------------------------------
-    SNAPSHOT_KEYS = [
+    SNAPSHOT_KEYS = (
         "name", "uuid", "bus_id",
         "memory_info",
         "memory_used", "memory_free", "memory_total",
@@ -303,11 +348,37 @@ class Device:  # pylint: disable=too-many-instance-attributes
         "persistence_mode", "performance_state",
         "total_volatile_uncorrected_ecc_errors",
         "compute_mode", "cuda_compute_capability",
-    ]
+    )
+
+    @classmethod
+    def _snapshot_keys(cls) -> tuple[str, ...]:
+        """The :attr:`SNAPSHOT_KEYS` that need an actual query, resolved once per class.
+
+        Keys backed by the shared N/A placeholder are left out and collected in the prebuilt
+        ``_SNAPSHOT_NA_VALUES`` dict instead.
+        """
+        try:
+            return cls.__dict__['_SNAPSHOT_QUERY_KEYS']
+        except KeyError:
+            pass
+        cls._SNAPSHOT_NA_VALUES = {
+            key: NA for key in cls.SNAPSHOT_KEYS if getattr(cls, key) is _na_getter
+        }
+        keys = tuple(key for key in cls.SNAPSHOT_KEYS if key not in cls._SNAPSHOT_NA_VALUES)
+        cls._SNAPSHOT_QUERY_KEYS = keys
+        return keys
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        keys = self._snapshot_keys()
+        data = self._SNAPSHOT_NA_VALUES.copy()
+        for key in keys:
+            # 走实例属性查找：TUI 会在实例上用 BufferedHistoryGraph 包装 memory_percent 等方法
+            data[key] = getattr(self, key)()
+        return data
 
     def as_snapshot(self) -> Snapshot:
         with self.oneshot():
-            data = {k: getattr(self, k)() for k in self.SNAPSHOT_KEYS}
+            data = self._snapshot_data()
             return Snapshot(
                 real=self,
                 index=self.index,
@@ -315,6 +386,11 @@ class Device:  # pylint: disable=too-many-instance-attributes
                 **data,
             )
 
+    @classmethod
+    def take_snapshots(cls, devices: Iterable[Device]) -> list[Snapshot]:
+        """Take snapshots for a list of devices."""
+        return [device.as_snapshot() for device in devices]
+
     def __repr__(self) -> str:
         return (
             f"Device(index={self.index}, "
@@ -323,24 +399,25 @@ class Device:  # pylint: disable=too-many-instance-attributes
         )
 
     def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):  # 常见情况：同类设备直接比槽位，跳过 isinstance 与 property
+            return other._index == self._index  # type: ignore[attr-defined]
         return isinstance(other, Device) and other.index == self.index
 
     def __hash__(self) -> int:
-        return hash((self.index, self.uuid()))
+        return self._hash
 
 
 # ────────────────────────────────────────────────────────────────
 # 动态打桩：Ascend 不支持的 NVML-only 接口全部返回 NA
 # ────────────────────────────────────────────────────────────────
-def _na_method(name: str):
-    def _impl(self, *args: Any, **kwargs: Any) -> Any:
-        return NA
-    _impl.__name__ = name
-    return _impl
+def _na_getter(self: Device, *args: Any, **kwargs: Any) -> NaType:
+    return NA
 
-for _name in Device.SNAPSHOT_KEYS:
-    if not hasattr(Device, _name):
-        setattr(Device, _name, _na_method(_name))
+_NA_SNAPSHOT_KEYS: frozenset[str] = frozenset(Device.SNAPSHOT_KEYS).difference(dir(Device))
+
+# 所有占位接口共享同一个函数对象，as_snapshot 据此直接填 NA 而不必调用
+for _name in _NA_SNAPSHOT_KEYS:
+    setattr(Device, _name, _na_getter)
 
 # ────────────────────────────────────────────────────────────────
 # 工具 & 导出
@@ -355,6 +432,14 @@ def _env_visible_devices() -> str | None:
         or None
     )
 
+# 逗号分隔列表中的纯数字项（其余项忽略），一次 finditer 完成切分 + 校验
+_VISIBLE_DEVICE_INDEX_PATTERN = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
+@functools.lru_cache(maxsize=32)
+def _parse_visible_devices(visible_devices: str) -> tuple[int, ...]:
+    # 只依赖环境变量字符串本身，按字符串缓存；返回 tuple 防止调用方改动缓存结果
+    return tuple(int(m.group(1)) for m in _VISIBLE_DEVICE_INDEX_PATTERN.finditer(visible_devices))
+
 def parse_cuda_visible_devices(
     cuda_visible_devices: str | None = None,
 ) -> list[int]:
@@ -362,12 +447,7 @@ def parse_cuda_visible_devices(
         cuda_visible_devices = _env_visible_devices()
     if not cuda_visible_devices:
         return list(range(Device.count()))
-    ids: list[int] = []
-    for tok in cuda_visible_devices.split(","):
-        tok = tok.strip()
-        if tok.isdigit():
-            ids.append(int(tok))
-    return ids
+    return list(_parse_visible_devices(cuda_visible_devices))
 
 def normalize_cuda_visible_devices(
     cuda_visible_devices: str | None = None,
@@ -16,7 +16,7 @@
 # limitations under the License.
 
 from __future__ import annotations
-import subprocess, re, time, sys
+import subprocess, re, time, sys, shutil, threading, functools
 from collections import namedtuple
 from types import ModuleType
 from typing import Any
@@ -34,6 +34,7 @@ _CACHE      : dict[int, dict[str,Any]] = {}   # 物理 id ↦ 数据
 _IDX        : list[int] = []                  # 逻辑 index ↦ 物理 id
 _CACHE_TTL  = 0.8
 _cache_ts   = 0.0
+_CACHE_LOCK = threading.Lock()                # 多线程（各面板 / collector）同时过期时只刷新一次
 _DRIVER_VERSION = None
 _POWER_LIMIT = {
     "310": None,
@@ -48,24 +49,65 @@ _POWER_LIMIT = {
     "910C": 350,
 }
 _npu_chip_phy : dict[tuple[int, int], int] = {} # (npu id, chip_id) ↦ phy id
+_NPU_SMI    : str | None = None               # npu-smi 可执行文件路径，ascendInit() 时解析一次
+_DRIVER_VERSION_INFO = "/usr/local/Ascend/driver/version.info"
+_POLLER     : threading.Thread | None = None  # ascendStartPolling() 启动的后台刷新线程
+_POLLER_STOP = threading.Event()
+_POLLER_WAKE = threading.Event()              # ascendForceRefresh() / 改 TTL 时提前唤醒后台线程
+_POLL_MAX_FAILURES = 3                         # 后台刷新连续失败这么多次后丢弃旧数据
 # --------- Regex ----------
+# 约定：所有正则都在这里编译一次，函数体内不再直接调用 re.search / re.findall(<str>, ...)
 _RE_L1 = re.compile(r"^\|\s*(\d+)\s+(\S+).*?\|\s*(\S+)\s+\|\s*([\d.]+|-)\s+(\d+)")
 _RE_L2 = re.compile(r"^\|\s*(\d+)\s+(\d*)\s*\|\s*([0-9A-Fa-f:.]+|NA)\s*\|\s*(\d+).*?\|$")
 _RE_P  = re.compile(r"^\|\s*(\d+)\s+(\d+)\s+\|\s+(\d+)\s+\|.*?\|\s+(\d+)")
 _RE_R = re.compile(r"^\|\s*(\S+)\s+([\d.rcRC]+)\s+Version:\s*([\d.rcRC]+)")
+# 芯片首行与进程行合成一条正则，每行只跑一次匹配，按命中的分支（lastgroup）取对应分组
+_RE_ROW = re.compile(f"(?P<chip>{_RE_L1.pattern})|(?P<proc>{_RE_P.pattern})")
+_ROW_CHIP = tuple(range(2, 2 + _RE_L1.groups))
+_ROW_PROC = tuple(range(3 + _RE_L1.groups, 3 + _RE_L1.groups + _RE_P.groups))
+_RE_PAIR = re.compile(r"(\d+)\s*/\s*(\d+)")   # "used / total"
+_RE_CANN = re.compile(r"version\s*=\s*([\w.+-]+)")   # ascend_toolkit_install.info
+_RE_DRIVER = re.compile(r"^Version\s*=\s*([\w.+-]+)", re.M)   # driver/version.info
 
 Util = namedtuple("UtilizationRates", ["npu", "mem", "bandwidth", "aicpu"])
+MemInfo  = namedtuple("MemoryInfo","total free used")
+ProcInfo = namedtuple("Proc","pid usedNpuMemory")
+_NO_MEM  = MemInfo(0,0,0)
+
+@functools.lru_cache(maxsize=1024)
+def _mem_pct(used: int, total: int):
+    # 显存读数在会话内变化不多，按 (used, total) 记忆，重复刷新时不再做浮点除法和 round
+    return round(100*used/total,1) if total else NA
 
 def _update_cache(raw: str = None) -> None:
-    global _cache_ts
-    global _DRIVER_VERSION
+    if raw is None and _POLLER is not None:   # 后台线程负责刷新，调用方只读表
+        return
     if time.time() - _cache_ts < _CACHE_TTL:
         return
+    with _CACHE_LOCK:
+        if time.time() - _cache_ts < _CACHE_TTL:  # 等锁期间已被其他线程刷新
+            return
+        _refresh_cache(raw)
 
+def _refresh_cache(raw: str = None) -> None:
+    global _CACHE, _IDX, _cache_ts
     if not raw:
         raw = subprocess.run(
-            ["npu-smi","info"], text=True, capture_output=True, timeout=3
+            [_NPU_SMI or "npu-smi","info"], text=True, capture_output=True, timeout=3
         ).stdout
+    data = _parse_smi(raw)
+
+    # 整体换绑而非原地 clear+update：并发读者只会看到旧表或新表，不会看到半空的表
+    if data.keys() != _CACHE.keys():    # 设备集合几乎不变，只有变化时才重排索引
+        _IDX = sorted(data)
+    _CACHE = data
+    _cache_ts = time.time()
+
+def _parse_smi(raw: str) -> dict[int, dict[str,Any]]:
+    """把 `npu-smi info` 的输出解析成 物理 id ↦ 数据（顺带更新 _DRIVER_VERSION / _npu_chip_phy）。"""
+    global _DRIVER_VERSION
+    # 逐行循环里的 regex 方法先绑定成局部变量，省掉每行的全局 + 属性查找
+    match_row, match_l2 = _RE_ROW.match, _RE_L2.match
     raw = raw.splitlines()
 
     data: dict[int, dict[str,Any]] = {}
@@ -79,11 +121,15 @@ def _update_cache(raw: str = None) -> None:
             _,_DRIVER_VERSION,_ = m0.groups()
     for ln in raw_iter:
         ln = ln.strip()
+        if not ln.startswith("|"):  # "+----" / "+====" 分隔线占一半行数，不必进正则
+            continue
 
-        m1 = _RE_L1.match(ln)
-        
-        if m1:
-            npu_id, name, ok, pwr, tmp = m1.groups()
+        m = match_row(ln)
+        if m is None:
+            continue
+
+        if m.lastgroup == "chip":
+            npu_id, name, ok, pwr, tmp = m.group(*_ROW_CHIP)
             cur_id = int(npu_id)
             
             ln1_data = dict(
@@ -103,7 +149,7 @@ def _update_cache(raw: str = None) -> None:
                 _npu_chip_phy[(d['npu_id'], d['chip_id'])] = cur_id
                 break 
 
-            m2 = _RE_L2.match(ln_l2)
+            m2 = match_l2(ln_l2)
             
             if m2:
                 chip_id, phy_id, bus, aic = m2.groups()
@@ -114,13 +160,13 @@ def _update_cache(raw: str = None) -> None:
                 d = data.setdefault(cur_id, {})
                 d.update(ln1_data)
 
-                pair = re.findall(r'(\d+)\s*/\s*(\d+)', ln_l2)[-1]
-                h_used, h_tot = map(int, pair)
+                *_, m_hbm = _RE_PAIR.finditer(ln_l2)    # 只要最后一组（HBM）
+                h_used, h_tot = map(int, m_hbm.groups())
                 d.update(
                     bus_id=bus,
                     aicore=int(aic),
-                    hbm_used=h_used * 1024 * 1024,
-                    hbm_total=h_tot * 1024 * 1024,
+                    hbm_used=h_used << 20,      # MB → B
+                    hbm_total=h_tot << 20,
                     **chip_id_kwargs,
                 )
                 _npu_chip_phy[(d['npu_id'], d['chip_id'])] = cur_id
@@ -131,35 +177,96 @@ def _update_cache(raw: str = None) -> None:
 
             continue
 
-        mp = _RE_P.match(ln)
-        if mp:
-            npu_id, chip_id, pid, mem = map(int, mp.groups())
-            assert (npu_id, chip_id) in _npu_chip_phy, f"Process found for unknown NPU {npu_id} Chip {chip_id}"
-            d = data.setdefault(_npu_chip_phy[(npu_id, chip_id)], {})
-            d.setdefault("procs", []).append((pid, mem * 1024 * 1024))
+        # 进程行
+        npu_id, chip_id, pid, mem = map(int, m.group(*_ROW_PROC))
+        assert (npu_id, chip_id) in _npu_chip_phy, f"Process found for unknown NPU {npu_id} Chip {chip_id}"
+        d = data.setdefault(_npu_chip_phy[(npu_id, chip_id)], {})
+        d.setdefault("procs", []).append(ProcInfo(pid, mem << 20))
 
+    # power/temp/procs 由芯片首行必然写入；缺 L2 行时其余字段由 getter 的 .get() 默认值兜底
     for d in data.values():
-        d.setdefault("power", NA); d.setdefault("temp", NA)
-        d.setdefault("aicore", NA)
-        d.setdefault("hbm_used", 0); d.setdefault("hbm_total", 0)
-        d.setdefault("procs", [])
-        mem_pct = (round(100*d["hbm_used"]/d["hbm_total"],1)
-                   if d["hbm_total"] else NA)
-        d["util"] = Util(d["aicore"], mem_pct, NA, NA)
-
-    _CACHE.clear(); _CACHE.update(data)
-    _IDX.clear();   _IDX.extend(sorted(_CACHE.keys()))
-    _cache_ts = time.time()
+        used, total = d.get("hbm_used", 0), d.get("hbm_total", 0)
+        d["util"] = Util(d.get("aicore", NA), _mem_pct(used, total), NA, NA)
+        # 每次刷新只建一次，各 getter 直接复用（namedtuple 不可变，可安全共享）
+        d["mem"] = MemInfo(total, total - used, used)
+    return data
+
+def ascendInit() -> None:
+    """进程内只需调用一次：解析 npu-smi 路径，避免每次 fork 时重复搜索 PATH。"""
+    global _NPU_SMI
+    if _NPU_SMI is None:
+        _NPU_SMI = shutil.which("npu-smi") or "npu-smi"
+
+def _poll_loop() -> None:
+    global _CACHE, _IDX
+    failures = 0
+    while True:
+        _POLLER_WAKE.wait(_CACHE_TTL)  # 每轮重新读 TTL，ascendSetRefreshInterval() 立即生效
+        _POLLER_WAKE.clear()
+        if _POLLER_STOP.is_set():
+            return
+        try:
+            with _CACHE_LOCK:
+                _refresh_cache()
+        except Exception:  # npu-smi 偶发超时 / 失败时先保留上一份数据
+            failures += 1
+            if failures >= _POLL_MAX_FAILURES:  # 连续失败则清空，getter 回落到 NA，不再显示过期数据
+                _CACHE, _IDX = {}, []
+        else:
+            failures = 0
+
+def ascendStartPolling(interval: float | None = None) -> None:
+    """在后台线程里按 TTL 刷新 npu-smi 表，之后的查询只读缓存，不再阻塞在子进程上。"""
+    global _POLLER
+    if interval is not None:
+        ascendSetRefreshInterval(interval)
+    if _POLLER is not None:
+        return
+    try:
+        _update_cache()  # 先同步刷新一次，保证第一帧就有数据
+    except Exception:
+        pass
+    _POLLER_STOP.clear(); _POLLER_WAKE.clear()
+    _POLLER = threading.Thread(target=_poll_loop, name="npu-smi-poller", daemon=True)
+    _POLLER.start()
+
+def ascendStopPolling(wait: bool = True) -> None:
+    """停止后台刷新线程；wait=False 时只发信号不等待（线程可能正卡在 npu-smi 子进程里）。"""
+    global _POLLER
+    poller, _POLLER = _POLLER, None
+    if poller is not None:
+        _POLLER_STOP.set(); _POLLER_WAKE.set()
+        if wait:
+            poller.join(timeout=5)
+
+def ascendSetRefreshInterval(seconds: float) -> None:
+    """调整 npu-smi 缓存的 TTL（同时也是后台线程的刷新周期）。"""
+    global _CACHE_TTL
+    _CACHE_TTL = max(float(seconds), 0.1)
+    _POLLER_WAKE.set()
+
+def ascendForceRefresh() -> None:
+    """丢弃当前缓存的时效：下一次查询（或后台线程的下一轮）立即重新执行 npu-smi。"""
+    global _cache_ts
+    _cache_ts = 0.0
+    _POLLER_WAKE.set()
+
+def ascendShutdown() -> None:
+    """释放 ascendInit() / _update_cache() 持有的全局状态。"""
+    global _NPU_SMI, _CACHE, _IDX, _cache_ts
+    ascendStopPolling(wait=False)  # 由 atexit 调用：daemon 线程不必等，退出时不被 npu-smi 拖住
+    _NPU_SMI = None
+    _cache_ts = 0.0
+    _CACHE, _IDX = {}, []
+    _npu_chip_phy.clear()
 
 def _phys(idx: int) -> int|None:
     _update_cache()
-    if 0 <= idx < len(_IDX):
-        return _IDX[idx]
+    ids = _IDX
+    if 0 <= idx < len(ids):
+        return ids[idx]
     return None
 
-MemInfo  = namedtuple("MemoryInfo","total free used")
-ProcInfo = namedtuple("Proc","pid usedNpuMemory")
-
 def ascendDeviceGetCount() -> int:
     _update_cache(); return len(_IDX)
 
@@ -167,38 +274,47 @@ def ascendDeviceGetName(i:int):             id=_phys(i); return _CACHE.get(id,{}
 def ascendDeviceGetTemperature(i:int):      id=_phys(i); return _CACHE.get(id,{}).get("temp",NA)
 def ascendDeviceGetPowerUsage(i:int):       id=_phys(i); return _CACHE.get(id,{}).get("power",NA)
 def ascendDeviceGetUtilizationRates(i:int): id=_phys(i); return _CACHE.get(id,{}).get("util",NA)
+def ascendDeviceGetBusId(i:int):           id=_phys(i); return _CACHE.get(id,{}).get("bus_id",NA)
 
 def ascendDeviceGetMemoryInfo(i:int):
     id=_phys(i)
-    if id is None: return MemInfo(0,0,0)
+    if id is None: return _NO_MEM
+    return _CACHE.get(id,{}).get("mem",_NO_MEM)
+
+def ascendDeviceGetAll(i:int):
+    """一次 _update_cache() + 一次查表返回 (temp, power, util, MemInfo)，供 Device.oneshot() 合并动态查询。"""
+    id=_phys(i)
+    if id is None: return NA, NA, NA, _NO_MEM
     d=_CACHE.get(id,{})
-    tot=d.get("hbm_total",0); used=d.get("hbm_used",0)
-    return MemInfo(tot, tot-used, used)
+    return d.get("temp",NA), d.get("power",NA), d.get("util",NA), d.get("mem",_NO_MEM)
 
 def ascendDeviceGetProcessInfo(i:int):
     id=_phys(i)
     if id is None: return []
-    return [ProcInfo(pid,mem) for pid,mem in _CACHE.get(id,{}).get("procs",[])]
+    return list(_CACHE.get(id,{}).get("procs",[]))   # 解析时已是 ProcInfo，这里只拷贝列表
+
+def _read_version_file(path: str, pattern: re.Pattern) -> str | None:
+    # 直接读安装目录下的版本文件，不 fork 子进程
+    try:
+        with open(path, encoding="utf-8") as f:
+            m = pattern.search(f.read())
+    except OSError:
+        return None
+    return m.group(1) if m else None
 
 def ascendSystemGetDriverVersion() -> str:
     global _DRIVER_VERSION
+    if _DRIVER_VERSION is None:  # 还没跑过 npu-smi 时先读驱动的 version.info
+        _DRIVER_VERSION = _read_version_file(_DRIVER_VERSION_INFO, _RE_DRIVER)
     return _DRIVER_VERSION or NA
 
 def ascendSystemGetCANNVersion() -> str:
-    arch = platform.machine()
-    arch_subdir_map = {"x86_64": "x86_64-linux", "aarch64": "aarch64-linux"}
-    arch_subdir = arch_subdir_map.get(arch)
-    try:
-        result = subprocess.run(['cat', f'/usr/local/Ascend/ascend-toolkit/latest/{arch_subdir}/ascend_toolkit_install.info'], 
-                              capture_output=True, text=True, check=True)
-        output = result.stdout
-        
-        match = re.search(r'version\s*=\s*([\w.+-]+)', output)
-        return match.group(1) if match else NA
-            
-    except (FileNotFoundError, PermissionError):
+    arch_subdir = {"x86_64": "x86_64-linux", "aarch64": "aarch64-linux"}.get(platform.machine())
+    if arch_subdir is None:
         return NA
-    
+    path = f"/usr/local/Ascend/ascend-toolkit/latest/{arch_subdir}/ascend_toolkit_install.info"
+    return _read_version_file(path, _RE_CANN) or NA
+
 def ascendDeviceGetPowerLimit(i:int):
     id=_phys(i)
     if id is None: return NA
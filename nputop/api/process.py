@@ -33,8 +33,6 @@ from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable
 from weakref import WeakValueDictionary
 
 from nputop.api import host
-# ★★★ 关键：NVML → Ascend 兼容层 ★★★
-from nputop.api import libascend as libnvml
 from nputop.api.utils import (
     NA,
     UINT_MAX,
@@ -472,6 +470,7 @@ class NpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
         npu_instance_id: int | NaType | None = None,
         compute_instance_id: int | NaType | None = None,
         type: str | NaType | None = None,  # pylint: disable=redefined-builtin
+        npu_utilization: tuple[int | NaType, int | NaType, int | NaType, int | NaType] | None = None,
         # pylint: enable=unused-argument
     ) -> Self:
         """Return the cached instance of :class:`NpuProcess`."""
@@ -510,8 +509,13 @@ class NpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
         npu_instance_id: int | NaType | None = None,
         compute_instance_id: int | NaType | None = None,
         type: str | NaType | None = None,  # pylint: disable=redefined-builtin
+        npu_utilization: tuple[int | NaType, int | NaType, int | NaType, int | NaType] | None = None,
     ) -> None:
-        """Initialize the instance returned by :meth:`__new__()`."""
+        """Initialize the instance returned by :meth:`__new__()`.
+
+        If given, ``npu_utilization`` is the ``(sm, memory, encoder, decoder)`` tuple passed to
+        :meth:`set_npu_utilization`, and overrides the previous values of a cached instance.
+        """
         if npu_memory is None and not hasattr(self, '_npu_memory'):
             npu_memory = NA
         if npu_memory is not None:
@@ -533,9 +537,17 @@ class NpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
         else:
             self._npu_instance_id = self._compute_instance_id = NA
 
-        for util in ('sm', 'memory', 'encoder', 'decoder'):
-            if not hasattr(self, f'_npu_{util}_utilization'):
-                setattr(self, f'_npu_{util}_utilization', NA)
+        if npu_utilization is not None:
+            (
+                self._npu_sm_utilization,
+                self._npu_memory_utilization,
+                self._npu_encoder_utilization,
+                self._npu_decoder_utilization,
+            ) = npu_utilization
+        else:
+            for util in ('sm', 'memory', 'encoder', 'decoder'):
+                if not hasattr(self, f'_npu_{util}_utilization'):
+                    setattr(self, f'_npu_{util}_utilization', NA)
 
     def __repr__(self) -> str:
         """Return a string representation of the NPU process."""
@@ -647,8 +659,8 @@ class NpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
         memory_total = self.device.memory_total()          # 可能是 0 / 'N/A'
         npu_memory_percent: float | NaType = NA
         if (
-            libnvml.nvmlCheckReturn(memory_used, int)
-            and libnvml.nvmlCheckReturn(memory_total, int)
+            type(memory_used) is int  # NA 是字符串，直接比类型，省掉两次 nvmlCheckReturn 调用
+            and type(memory_total) is int
             and memory_total > 0                            # ← 关键保护
         ):
             npu_memory_percent = round(100.0 * memory_used / memory_total, 1)
@@ -773,3 +773,28 @@ def memoize_when_activated(method: Method) -> Method:
     wrapped.cache_activate = cache_activate  # type: ignore[attr-defined]
     wrapped.cache_deactivate = cache_deactivate  # type: ignore[attr-defined]
     return wrapped  # type: ignore[return-value]
+
+
+def memoize_static(method: Method) -> Method:
+    """A memoize decorator for methods that return values which never change during the lifetime of the instance.
+
+    The result is stored in the ``_static_cache`` instance attribute (a :class:`dict`) on the first
+    successful call. Failed queries (:const:`NA` or empty values) are not cached and will be retried
+    on the next call. It can be used only against methods accepting no arguments.
+    """  # pylint: disable=line-too-long
+    key = method.__name__
+
+    @functools.wraps(method)
+    def wrapped(self: object) -> Any:
+        try:
+            # pylint: disable-next=protected-access
+            return self._static_cache[key]  # type: ignore[attr-defined]
+        except KeyError:
+            pass
+        ret = method(self)
+        if ret and ret != NA:
+            # pylint: disable-next=protected-access
+            self._static_cache[key] = ret  # type: ignore[attr-defined]
+        return ret
+
+    return wrapped  # type: ignore[return-value]
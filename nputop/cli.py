@@ -4,13 +4,14 @@
 
 """The interactive Ascend-NPU process viewer."""
 
+from __future__ import annotations
+
 import argparse
 import curses
 import os
 import sys
-import textwrap
 
-from nputop.api import HostProcess
+from nputop.api import HostProcess, libascend
 from nputop.gui import UI, USERNAME, Device, colored, libcurses, set_color, setlocale_utf8
 from nputop.version import __version__
 
@@ -24,6 +25,21 @@ nputop_MONITOR_MODE = set(
 )
 
 
+def _parse_thresholds(name: str) -> list[int] | None:
+    """Parse a ``'th1,th2'`` environment variable into a pair of thresholds, or :data:`None`."""
+    try:
+        thresholds = list(map(int, os.getenv(name, '').split(',')))[:2]
+    except ValueError:
+        return None
+    if len(thresholds) == 2 and min(thresholds) > 0 and max(thresholds) < 100:
+        return thresholds
+    return None
+
+
+nputop_NPU_UTILIZATION_THRESHOLDS = _parse_thresholds('nputop_NPU_UTILIZATION_THRESHOLDS')
+nputop_MEMORY_UTILIZATION_THRESHOLDS = _parse_thresholds('nputop_MEMORY_UTILIZATION_THRESHOLDS')
+
+
 # pylint: disable=too-many-branches,too-many-statements
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments for ``nputop``."""
@@ -238,37 +254,22 @@ def parse_arguments() -> argparse.Namespace:
     if args.user is not None and len(args.user) == 0:
         args.user.append(USERNAME)
     if args.npu_util_thresh is None:
-        try:
-            npu_util_thresh = list(
-                map(int, os.getenv('nputop_NPU_UTILIZATION_THRESHOLDS', '').split(',')),
-            )[:2]
-        except ValueError:
-            pass
-        else:
-            if (
-                len(npu_util_thresh) == 2
-                and min(npu_util_thresh) > 0
-                and max(npu_util_thresh) < 100
-            ):
-                args.npu_util_thresh = npu_util_thresh
+        args.npu_util_thresh = nputop_NPU_UTILIZATION_THRESHOLDS
     if args.mem_util_thresh is None:
-        try:
-            mem_util_thresh = list(
-                map(int, os.getenv('nputop_MEMORY_UTILIZATION_THRESHOLDS', '').split(',')),
-            )[:2]
-        except ValueError:
-            pass
-        else:
-            if (
-                len(mem_util_thresh) == 2
-                and min(mem_util_thresh) > 0
-                and max(mem_util_thresh) < 100
-            ):
-                args.mem_util_thresh = mem_util_thresh
+        args.mem_util_thresh = nputop_MEMORY_UTILIZATION_THRESHOLDS
 
     return args
 
 
+def _running_under_watch() -> bool:
+    """Check whether ``nputop`` is run as ``watch nputop``."""
+    parent = HostProcess().parent()
+    if parent is None:
+        return False
+    grandparent = parent.parent()
+    return grandparent is not None and parent.name() == 'sh' and grandparent.name() == 'watch'
+
+
 # pylint: disable-next=too-many-branches,too-many-statements,too-many-locals
 def main() -> int:
     """Main function for ``nputop`` CLI."""
@@ -314,40 +315,48 @@ def main() -> int:
         Device.MEMORY_UTILIZATION_THRESHOLDS = tuple(sorted(args.mem_util_thresh))
 
     if args.only is not None:
-        indices = set(args.only)
-        invalid_indices = indices.difference(range(device_count))
-        indices.intersection_update(range(device_count))
+        indices, invalid_indices = set(), set()
+        for index in args.only:
+            (indices if 0 <= index < device_count else invalid_indices).add(index)
         if len(invalid_indices) > 1:
             messages.append(f'ERROR: Invalid device indices: {sorted(invalid_indices)}.')
         elif len(invalid_indices) == 1:
             messages.append(f'ERROR: Invalid device index: {next(iter(invalid_indices))}.')
+        devices = Device.from_indices(sorted(indices))
     elif args.only_visible:
         indices = {
             index if isinstance(index, int) else index[0]
             for index in Device.parse_cuda_visible_devices()
         }
+        devices = Device.from_indices(sorted(indices))
     else:
-        indices = set(range(device_count))
-    devices = Device.from_indices(sorted(indices))
-
-    filters = []
-    if args.compute:
-        filters.append(lambda process: 'C' in process.type or 'X' in process.type)
-    if args.only_compute:
-        filters.append(lambda process: 'G' not in process.type and 'X' not in process.type)
-    if args.graphics:
-        filters.append(lambda process: 'G' in process.type or 'X' in process.type)
-    if args.only_graphics:
-        filters.append(lambda process: 'C' not in process.type and 'X' not in process.type)
-    if args.user is not None:
-        users = set(args.user)
-        filters.append(lambda process: process.username in users)
-    if args.pid is not None:
-        pids = set(args.pid)
-        filters.append(lambda process: process.pid in pids)
+        devices = Device.all()
+
+    compute, only_compute = args.compute, args.only_compute
+    graphics, only_graphics = args.graphics, args.only_graphics
+    users = set(args.user) if args.user is not None else None
+    pids = set(args.pid) if args.pid is not None else None
+
+    def process_filter(process):
+        # All switches fused into one predicate: one call and one `type` lookup per process
+        process_type = process.type
+        return (
+            (not compute or 'C' in process_type or 'X' in process_type)
+            and (not only_compute or ('G' not in process_type and 'X' not in process_type))
+            and (not graphics or 'G' in process_type or 'X' in process_type)
+            and (not only_graphics or ('C' not in process_type and 'X' not in process_type))
+            and (users is None or process.username in users)
+            and (pids is None or process.pid in pids)
+        )
+
+    filtering = compute or only_compute or graphics or only_graphics
+    filters = [process_filter] if filtering or users is not None or pids is not None else []
 
     ui = None
     if hasattr(args, 'monitor') and len(devices) > 0:
+        # Refresh npu-smi data in the background (at the `--interval` pace, if given) so that
+        # redraws never wait on the subprocess
+        libascend.ascendStartPolling(interval=args.interval)
         try:
             with libcurses(colorful=args.colorful, light_theme=args.light) as win:
                 ui = UI(
@@ -366,33 +375,27 @@ def main() -> int:
 
     if ui is None:
         ui = UI(devices, filters, ascii=args.ascii)
-        if not sys.stdout.isatty():
-            parent = HostProcess().parent()
-            if parent is not None:
-                grandparent = parent.parent()
-                if (
-                    grandparent is not None
-                    and parent.name() == 'sh'
-                    and grandparent.name() == 'watch'
-                ):
-                    messages.append(
-                        'HINT: You are running `nputop` under `watch` command. '
-                        'Please try `nputop -m` directly.',
-                    )
-
-    ui.print()
+        ui.print()
+        # Inspect the process tree only after the output has been written
+        if not sys.stdout.isatty() and _running_under_watch():
+            messages.append(
+                'HINT: You are running `nputop` under `watch` command. '
+                'Please try `nputop -m` directly.',
+            )
+    else:
+        ui.print()
     ui.destroy()
 
     if len(messages) > 0:
+        # Built here rather than at import time: `--force-color` may have just enabled coloring
+        colored_prefixes = {
+            prefix: colored(prefix, color=color, attrs=('bold',))
+            for prefix, color in (('ERROR:', 'red'), ('WARNING:', 'yellow'), ('HINT:', 'green'))
+        }
         for message in messages:
-            for prefix, color in (('ERROR:', 'red'), ('WARNING:', 'yellow'), ('HINT:', 'green')):
-                if message.startswith(prefix):
-                    message = message.replace(
-                        prefix,
-                        colored(prefix, color=color, attrs=('bold',)),
-                        1,
-                    )
-                    break
+            prefix = message.partition(' ')[0]
+            if prefix in colored_prefixes:
+                message = colored_prefixes[prefix] + message[len(prefix) :]
             print(message, file=sys.stderr)
         return 1
     return 0
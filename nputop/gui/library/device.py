@@ -4,18 +4,41 @@
 
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 
-from cachetools.func import ttl_cache
+import functools
 
 from nputop.api import NA
 from nputop.api import MigDevice as MigDeviceBase
 from nputop.api import PhysicalDevice as DeviceBase
-from nputop.api import utilization2string
 from nputop.gui.library.process import NpuProcess
+from nputop.gui.library.utils import cached_utilization2string
 
 
 __all__ = ['Device', 'NA']
 
 
+def _tick_cached(name):
+    """Cache the base device method ``name`` until the next :meth:`Device.advance_tick` call.
+
+    The cache is keyed by ``name`` rather than ``func.__name__``: unsupported fields all share the
+    same N/A placeholder function.
+    """
+    func = getattr(DeviceBase, name)
+
+    @functools.wraps(func)
+    def wrapped(self):
+        tick = Device._tick  # pylint: disable=protected-access
+        entry = self._tick_cache.get(name)  # pylint: disable=protected-access
+        if entry is not None and entry[0] == tick:
+            return entry[1]
+        value = func(self)
+        self._tick_cache[name] = (tick, value)  # pylint: disable=protected-access
+        return value
+
+    wrapped.__name__ = name
+    wrapped.__qualname__ = f'Device.{name}'
+    return wrapped
+
+
 class Device(DeviceBase):
     NPU_PROCESS_CLASS = NpuProcess
 
@@ -23,7 +46,9 @@ class Device(DeviceBase):
     NPU_UTILIZATION_THRESHOLDS = (10, 75)
     INTENSITY2COLOR = {'light': 'green', 'moderate': 'yellow', 'heavy': 'red'}
 
-    SNAPSHOT_KEYS = [
+    _tick = 0
+
+    SNAPSHOT_KEYS = (
         'name',
         'bus_id',
         'memory_used',
@@ -60,21 +85,26 @@ class Device(DeviceBase):
         'npu_display_color',
         'loading_intensity',
         'display_color',
-    ]
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._snapshot = None
+        self._tick_cache = {}
         self.tuple_index = (self.index,) if isinstance(self.index, int) else self.index
         self.display_index = ':'.join(map(str, self.tuple_index))
 
     def as_snapshot(self):
         self._snapshot = super().as_snapshot()
-        self._snapshot.tuple_index = self.tuple_index
-        self._snapshot.display_index = self.display_index
+        vars(self._snapshot).update(tuple_index=self.tuple_index, display_index=self.display_index)
         return self._snapshot
 
+    @classmethod
+    def advance_tick(cls):
+        """Invalidate the per-tick cached values of all devices, called once per UI refresh."""
+        cls._tick += 1
+
     @property
     def snapshot(self):
         if self._snapshot is None:
@@ -95,46 +125,47 @@ class Device(DeviceBase):
 
         return mig_devices
 
-    fan_speed = ttl_cache(ttl=5.0)(DeviceBase.fan_speed)
-    temperature = ttl_cache(ttl=5.0)(DeviceBase.temperature)
-    power_usage = ttl_cache(ttl=5.0)(DeviceBase.power_usage)
-    display_active = ttl_cache(ttl=5.0)(DeviceBase.display_active)
-    display_mode = ttl_cache(ttl=5.0)(DeviceBase.display_mode)
-    current_driver_model = ttl_cache(ttl=5.0)(DeviceBase.current_driver_model)
-    persistence_mode = ttl_cache(ttl=5.0)(DeviceBase.persistence_mode)
-    performance_state = ttl_cache(ttl=5.0)(DeviceBase.performance_state)
-    total_volatile_uncorrected_ecc_errors = ttl_cache(ttl=5.0)(
-        DeviceBase.total_volatile_uncorrected_ecc_errors,
-    )
-    compute_mode = ttl_cache(ttl=5.0)(DeviceBase.compute_mode)
-    mig_mode = ttl_cache(ttl=5.0)(DeviceBase.mig_mode)
+    fan_speed = _tick_cached('fan_speed')
+    temperature = _tick_cached('temperature')
+    power_usage = _tick_cached('power_usage')
+    display_active = _tick_cached('display_active')
+    display_mode = _tick_cached('display_mode')
+    current_driver_model = _tick_cached('current_driver_model')
+    persistence_mode = _tick_cached('persistence_mode')
+    performance_state = _tick_cached('performance_state')
+    total_volatile_uncorrected_ecc_errors = _tick_cached('total_volatile_uncorrected_ecc_errors')
+    compute_mode = _tick_cached('compute_mode')
+    mig_mode = _tick_cached('mig_mode')
 
     def memory_percent_string(self):  # in percentage
-        return utilization2string(self.memory_percent())
+        return cached_utilization2string(self.memory_percent())
 
     def memory_utilization_string(self):  # in percentage
-        return utilization2string(self.memory_utilization())
+        return cached_utilization2string(self.memory_utilization())
 
     def npu_utilization_string(self):  # in percentage
-        return utilization2string(self.npu_utilization())
+        return cached_utilization2string(self.npu_utilization())
 
     def fan_speed_string(self):  # in percentage
-        return utilization2string(self.fan_speed())
+        return cached_utilization2string(self.fan_speed())
 
     def temperature_string(self):  # in Celsius
         return self.temperature()
 
     def memory_loading_intensity(self):
-        return self.loading_intensity_of(self.memory_percent(), type='memory')
+        return self._intensity(self.memory_percent(), self.MEMORY_UTILIZATION_THRESHOLDS)
 
     def npu_loading_intensity(self):
-        return self.loading_intensity_of(self.npu_utilization(), type='npu')
+        return self._intensity(self.npu_utilization(), self.NPU_UTILIZATION_THRESHOLDS)
 
     def loading_intensity(self):
-        loading_intensity = (self.memory_loading_intensity(), self.npu_loading_intensity())
-        if 'heavy' in loading_intensity:
+        memory_loading_intensity = self.memory_loading_intensity()
+        if memory_loading_intensity == 'heavy':
+            return 'heavy'
+        npu_loading_intensity = self.npu_loading_intensity()
+        if npu_loading_intensity == 'heavy':
             return 'heavy'
-        if 'moderate' in loading_intensity:
+        if 'moderate' in (memory_loading_intensity, npu_loading_intensity):
             return 'moderate'
         return 'light'
 
@@ -154,22 +185,23 @@ class Device(DeviceBase):
         return self.INTENSITY2COLOR.get(self.npu_loading_intensity())
 
     @staticmethod
-    def loading_intensity_of(utilization, type='memory'):  # pylint: disable=redefined-builtin
-        thresholds = {
-            'memory': Device.MEMORY_UTILIZATION_THRESHOLDS,
-            'npu': Device.NPU_UTILIZATION_THRESHOLDS,
-        }.get(type)
-        if utilization == NA:
-            return 'moderate'
-        if isinstance(utilization, str):
-            utilization = utilization.replace('%', '')
-        utilization = float(utilization)
-        if utilization >= thresholds[-1]:
+    def _intensity(utilization, thresholds):
+        if isinstance(utilization, str):  # NA or a formatted percentage
+            if utilization == NA:
+                return 'moderate'
+            utilization = float(utilization.replace('%', ''))
+        if utilization >= thresholds[1]:
             return 'heavy'
         if utilization >= thresholds[0]:
             return 'moderate'
         return 'light'
 
+    @staticmethod
+    def loading_intensity_of(utilization, type='memory'):  # pylint: disable=redefined-builtin
+        if type == 'memory':
+            return Device._intensity(utilization, Device.MEMORY_UTILIZATION_THRESHOLDS)
+        return Device._intensity(utilization, Device.NPU_UTILIZATION_THRESHOLDS)
+
     @staticmethod
     def color_of(utilization, type='memory'):  # pylint: disable=redefined-builtin
         return Device.INTENSITY2COLOR.get(Device.loading_intensity_of(utilization, type=type))
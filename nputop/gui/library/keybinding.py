@@ -108,7 +108,7 @@ def _special_keys_init():
 
 _special_keys_init()
 del _special_keys_init, VERY_SPECIAL_KEYS, NAMED_SPECIAL_KEYS
-REVERSED_SPECIAL_KEYS = OrderedDict([(v, k) for k, v in SPECIAL_KEYS.items()])
+REVERSED_SPECIAL_KEYS = {v: k for k, v in SPECIAL_KEYS.items()}
 
 
 def parse_keybinding(obj):  # pylint: disable=too-many-branches
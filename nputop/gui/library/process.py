@@ -7,7 +7,8 @@
 
 from nputop.api import NA, GiB
 from nputop.api import NpuProcess as NpuProcessBase
-from nputop.api import HostProcess, Snapshot, bytes2human, host, timedelta2human, utilization2string
+from nputop.api import HostProcess, Snapshot, bytes2human, host, timedelta2human
+from nputop.gui.library.utils import cached_utilization2string
 
 
 __all__ = [
@@ -56,42 +57,44 @@ class NpuProcess(NpuProcessBase):
     def as_snapshot(self, *, host_process_snapshot_cache=None) -> Snapshot:
         snapshot = super().as_snapshot(host_process_snapshot_cache=host_process_snapshot_cache)
 
-        snapshot.type = snapshot.type.replace('C+G', 'X')
-        if snapshot.npu_memory_human == NA and (host.WINDOWS or host.WSL):
-            snapshot.npu_memory_human = 'WDDM:N/A'
-
-        snapshot.cpu_percent_string = snapshot.host.cpu_percent_string
-        snapshot.memory_percent_string = snapshot.host.memory_percent_string
-
-        if snapshot.is_running:
-            snapshot.is_zombie = snapshot.cmdline == ['Zombie Process']
-            snapshot.no_permissions = snapshot.cmdline == ['No Permissions']
-            snapshot.is_gone = False
-        else:
-            snapshot.is_zombie = False
-            snapshot.no_permissions = False
-            snapshot.is_gone = snapshot.cmdline == ['No Such Process']
-
-        snapshot.npu_memory_percent_string = self.npu_memory_percent_string()
-        snapshot.npu_sm_utilization_string = self.npu_sm_utilization_string()
-        snapshot.npu_memory_utilization_string = self.npu_memory_utilization_string()
-        snapshot.npu_encoder_utilization_string = self.npu_encoder_utilization_string()
-        snapshot.npu_decoder_utilization_string = self.npu_decoder_utilization_string()
+        cmdline = snapshot.cmdline
+        # The placeholder cmdlines ('Zombie Process' etc.) are always single-element lists
+        placeholder = cmdline[0] if len(cmdline) == 1 else None
+        is_running = snapshot.is_running
+        npu_memory_human = snapshot.npu_memory_human
+        if npu_memory_human == NA and (host.WINDOWS or host.WSL):
+            npu_memory_human = 'WDDM:N/A'
+
+        # One dict update instead of a dozen attribute stores on the snapshot
+        vars(snapshot).update(
+            type=snapshot.type.replace('C+G', 'X'),
+            npu_memory_human=npu_memory_human,
+            cpu_percent_string=snapshot.host.cpu_percent_string,
+            memory_percent_string=snapshot.host.memory_percent_string,
+            is_zombie=is_running and placeholder == 'Zombie Process',
+            no_permissions=is_running and placeholder == 'No Permissions',
+            is_gone=not is_running and placeholder == 'No Such Process',
+            npu_memory_percent_string=self.npu_memory_percent_string(),
+            npu_sm_utilization_string=self.npu_sm_utilization_string(),
+            npu_memory_utilization_string=self.npu_memory_utilization_string(),
+            npu_encoder_utilization_string=self.npu_encoder_utilization_string(),
+            npu_decoder_utilization_string=self.npu_decoder_utilization_string(),
+        )
 
         self._snapshot = snapshot  # pylint: disable=attribute-defined-outside-init
         return snapshot
 
     def npu_memory_percent_string(self) -> str:  # in percentage
-        return utilization2string(self.npu_memory_percent())
+        return cached_utilization2string(self.npu_memory_percent())
 
     def npu_sm_utilization_string(self) -> str:  # in percentage
-        return utilization2string(self.npu_sm_utilization())
+        return cached_utilization2string(self.npu_sm_utilization())
 
     def npu_memory_utilization_string(self) -> str:  # in percentage
-        return utilization2string(self.npu_memory_utilization())
+        return cached_utilization2string(self.npu_memory_utilization())
 
     def npu_encoder_utilization_string(self) -> str:  # in percentage
-        return utilization2string(self.npu_encoder_utilization())
+        return cached_utilization2string(self.npu_encoder_utilization())
 
     def npu_decoder_utilization_string(self) -> str:  # in percentage
-        return utilization2string(self.npu_decoder_utilization())
+        return cached_utilization2string(self.npu_decoder_utilization())
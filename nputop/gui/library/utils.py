@@ -5,10 +5,11 @@
 # pylint: disable=missing-module-docstring,missing-function-docstring
 
 import contextlib
+import functools
 import math
 import os
 
-from nputop.api import NA, colored, host, set_color  # noqa: F401 # pylint: disable=unused-import
+from nputop.api import NA, colored, host, set_color, utilization2string  # noqa: F401 # pylint: disable=unused-import
 from nputop.gui.library.widestring import WideString
 
 
@@ -38,6 +39,10 @@ USERCONTEXT = f'{USERNAME}@{HOSTNAME}'
 LARGE_INTEGER = 65536
 
 
+# Percentages repeat across UI ticks, so format each distinct value once (typed: 1 and 1.0 differ)
+cached_utilization2string = functools.lru_cache(maxsize=256, typed=True)(utilization2string)
+
+
 def cut_string(s, maxlen, padstr='...', align='left'):
     assert align in {'left', 'right'}
 
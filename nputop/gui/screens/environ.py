@@ -4,7 +4,6 @@
 
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 
-from collections import OrderedDict
 from functools import partial
 from itertools import islice
 
@@ -80,7 +79,7 @@ class EnvironScreen(Displayable):  # pylint: disable=too-many-instance-attribute
                 (WideString(key), WideString(f'{key}={normalize(value[key])}'))
                 for key in sorted(value.keys())
             ]
-            value = OrderedDict(self.items)
+            value = dict(self.items)
         else:
             self.items = None
         self._environ = value
@@ -7,6 +7,7 @@
 import threading
 from functools import partial
 
+from nputop.api import libascend
 from nputop.gui.library import LARGE_INTEGER, DisplayableContainer, MouseEvent, send_signal
 from nputop.gui.screens.main.device import DevicePanel
 from nputop.gui.screens.main.host import HostPanel
@@ -174,6 +175,7 @@ class MainScreen(DisplayableContainer):  # pylint: disable=too-many-instance-att
             self.root.update_size()
 
         def force_refresh():
+            libascend.ascendForceRefresh()
             select_clear()
             host_begin()
             self.y = self.root.y
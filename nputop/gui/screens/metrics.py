@@ -8,7 +8,6 @@
 import itertools
 import threading
 import time
-from collections import OrderedDict
 
 from nputop.gui.library import (
     HOSTNAME,
@@ -398,7 +397,7 @@ class ProcessMetricsScreen(Displayable):  # pylint: disable=too-many-instance-at
 
         with self.snapshot_lock:
             process = self.process.snapshot
-            columns = OrderedDict(
+            columns = dict(
                 [
                     (' NPU', self.process.device.display_index.rjust(4)),
                     ('PID  ', f'{str(process.pid).rjust(3)} {process.type}'),
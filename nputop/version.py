@@ -12,33 +12,34 @@ if not __release__:
     import os
     import subprocess
 
-    try:
-        # 通过 git tag 自动生成 dev 版本号
-        prefix, sep, suffix = (
-            subprocess.check_output(
-                ['git', 'describe', '--abbrev=7'],
-                cwd=os.path.dirname(os.path.abspath(__file__)),
-                stderr=subprocess.DEVNULL,
-                text=True,
-            )
-            .strip()
-            .lstrip('v')
-            .replace('-', '.dev', 1)
-            .replace('-', '+', 1)
-            .partition('.dev')
-        )
-        if sep:
-            version_prefix, dot, version_tail = prefix.rpartition('.')
-            prefix = f'{version_prefix}{dot}{int(version_tail) + 1}'
-            __version__ = f'{prefix}{sep}{suffix}'
-        else:
-            __version__ = prefix
-    except (OSError, subprocess.CalledProcessError):
-        # 如果无法调用 git，就保持手写的 __version__
-        pass
-    finally:
-        # 清理临时导入
+    # 只有在源码仓库里才调用 git；pip 安装后不存在 .git，省掉每次 import 时的一次 fork
+    if os.path.exists(
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.git'),
+    ):
         try:
-            del os, subprocess
-        except NameError:
+            # 通过 git tag 自动生成 dev 版本号
+            prefix, sep, suffix = (
+                subprocess.check_output(
+                    ['git', 'describe', '--abbrev=7'],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+                .strip()
+                .lstrip('v')
+                .replace('-', '.dev', 1)
+                .replace('-', '+', 1)
+                .partition('.dev')
+            )
+            if sep:
+                version_prefix, dot, version_tail = prefix.rpartition('.')
+                prefix = f'{version_prefix}{dot}{int(version_tail) + 1}'
+                __version__ = f'{prefix}{sep}{suffix}'
+            else:
+                __version__ = prefix
+        except (OSError, subprocess.CalledProcessError):
+            # 如果无法调用 git，就保持手写的 __version__
             pass
+
+    # 清理临时导入
+    del os, subprocess
@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+from test_libascend import TEST_CASES
+
+from nputop.api import NA, Device, libascend, parse_cuda_visible_devices
+from nputop.api.utils import memoize_static
+
+
+@pytest.fixture
+def npusmi_cache():
+    """Serve the four-chip fixture from the npu-smi cache without running npu-smi."""
+    libascend._cache_ts = 0.0
+    libascend._update_cache(TEST_CASES[2][0])
+    libascend._cache_ts = float('inf')
+    yield
+    libascend._cache_ts = 0.0
+
+
+def run_with_timeout(func, timeout=5.0):
+    """Run ``func`` in a daemon thread so that a deadlock fails the test instead of hanging it."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()), daemon=True)
+    thread.start()
+    thread.join(timeout=timeout)
+    assert not thread.is_alive(), f'{func.__name__}() deadlocked'
+    return result[0]
+
+
+def test_take_snapshots_duplicate_device(npusmi_cache):
+    device = Device(0)
+
+    def take_snapshots():
+        return Device.take_snapshots([device, device])
+
+    snapshots = run_with_timeout(take_snapshots)
+    assert [snapshot.real for snapshot in snapshots] == [device, device]
+    assert snapshots[0].memory_used == snapshots[1].memory_used == 3133 << 20
+
+
+def test_oneshot_nested(npusmi_cache):
+    device = Device(1)
+
+    def nested():
+        with device.oneshot():
+            with device.oneshot():
+                snapshot = device.as_snapshot()
+            assert hasattr(device, '_cache')
+        return snapshot
+
+    snapshot = run_with_timeout(nested)
+    assert not hasattr(device, '_cache')
+    assert snapshot.memory_used == 2876 << 20
+
+
+@pytest.mark.parametrize(
+    ('visible_devices', 'expected'),
+    [
+        ('0,1,2', [0, 1, 2]),
+        (' 3 , 1 ', [3, 1]),
+        ('2', [2]),
+        ('0,GPU-abc,1', [0, 1]),
+        ('x', []),
+    ],
+)
+def test_parse_cuda_visible_devices(visible_devices, expected):
+    assert parse_cuda_visible_devices(visible_devices) == expected
+
+
+def test_parse_cuda_visible_devices_cached():
+    devices = parse_cuda_visible_devices('0,1')
+    devices.append(2)  # callers get a fresh list, so mutating one does not poison the cache
+    assert parse_cuda_visible_devices('0,1') == [0, 1]
+    assert parse_cuda_visible_devices('0,1') is not parse_cuda_visible_devices('0,1')
+
+
+def test_parse_cuda_visible_devices_unset(npusmi_cache):
+    assert parse_cuda_visible_devices('') == [0, 1, 2, 3]
+
+
+def test_memoize_static():
+    class Probe:
+        def __init__(self, values):
+            self._static_cache = {}
+            self.values = iter(values)
+            self.calls = 0
+
+        @memoize_static
+        def name(self):
+            self.calls += 1
+            return next(self.values)
+
+    probe = Probe(['Ascend910', 'changed'])
+    assert probe.name() == 'Ascend910'
+    assert probe.name() == 'Ascend910'
+    assert probe.calls == 1
+
+    probe = Probe([NA, 'N/A', '', 'Ascend910', 'changed'])
+    assert probe.name() == NA
+    assert probe.name() == 'N/A'
+    assert probe.name() == ''
+    assert probe.name() == 'Ascend910'  # N/A and empty results are retried, not cached
+    assert probe.name() == 'Ascend910'
+    assert probe.calls == 4
+
+
+def test_gui_tick_cache_keys(npusmi_cache):
+    from nputop.gui.library.device import Device as GuiDevice  # pylint: disable=import-outside-toplevel
+
+    device = GuiDevice(3)
+    assert device.temperature() == 38
+    assert device.total_volatile_uncorrected_ecc_errors() == NA
+    assert device.compute_mode() == Device.compute_mode(device)
+    assert {'temperature', 'total_volatile_uncorrected_ecc_errors', 'compute_mode'} <= set(device._tick_cache)
+    assert '_na_getter' not in device._tick_cache
+
+
+def test_snapshot_when_npusmi_fails(npusmi_cache, monkeypatch):
+    def timeout(*args, **kwargs):
+        raise TimeoutError
+
+    monkeypatch.setattr(libascend, 'ascendDeviceGetAll', timeout)
+    snapshot = Device(0).as_snapshot()
+    assert snapshot.memory_used == 0
+    assert snapshot.memory_percent == NA
+    assert snapshot.temperature == NA
+    assert snapshot.npu_utilization == NA
+
+
+def test_snapshot_uses_instance_overrides(npusmi_cache):
+    from nputop.gui.library.device import Device as GuiDevice  # pylint: disable=import-outside-toplevel
+
+    device = GuiDevice(2)
+    device.memory_percent = lambda: 42.0  # as the TUI host panel wraps it with a history graph
+    snapshot = device.as_snapshot()
+    assert snapshot.memory_percent == 42.0
+    assert snapshot.memory_used == 3116 << 20
+    assert snapshot.pcie_throughput == NA
+
+
+def test_memory_total_recovers_after_failed_query(npusmi_cache, monkeypatch):
+    get_all = libascend.ascendDeviceGetAll
+
+    def timeout(*args, **kwargs):
+        raise TimeoutError
+
+    device = Device(0)
+    monkeypatch.setattr(libascend, 'ascendDeviceGetAll', timeout)
+    assert device.memory_total() == 0
+    assert device.memory_total_human() == '0B'
+
+    monkeypatch.setattr(libascend, 'ascendDeviceGetAll', get_all)
+    assert device.memory_total() == 65536 << 20
+    assert device.memory_total_human() == '64.00GiB'
+    assert device.as_snapshot().memory_usage.endswith('/ 64.00GiB')
@@ -1,3 +1,5 @@
+import subprocess
+import threading
 import time
 
 import pytest
@@ -195,3 +197,137 @@ def test_npusmi_parse(raw, expected_cache):
         cached_val = libascend._CACHE[key]
         for field, value in expected_val.items():
             assert cached_val[field] == value
+
+
+@pytest.fixture
+def npusmi_poller(monkeypatch):
+    """Replace the npu-smi subprocess with the ``npusmi_empty`` fixture and count the refreshes."""
+    refresh_cache = libascend._refresh_cache
+    calls = []
+
+    def fake_refresh_cache(raw=None):
+        calls.append(raw)
+        refresh_cache(TEST_CASES[2][0])
+
+    monkeypatch.setattr(libascend, '_refresh_cache', fake_refresh_cache)
+    ttl = libascend._CACHE_TTL
+    libascend._cache_ts = 0.0
+    yield calls
+    libascend.ascendStopPolling()
+    libascend._CACHE_TTL = ttl
+    libascend._cache_ts = 0.0
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_polling_start_stop(npusmi_poller):
+    libascend.ascendStartPolling(interval=0.1)
+    poller = libascend._POLLER
+    assert poller is not None and poller.is_alive()
+    assert libascend.ascendDeviceGetCount() == 4
+    assert wait_until(lambda: len(npusmi_poller) >= 3)
+
+    libascend.ascendStopPolling()
+    assert libascend._POLLER is None
+    assert not poller.is_alive()
+    refreshes = len(npusmi_poller)
+    time.sleep(0.3)
+    assert len(npusmi_poller) == refreshes
+
+
+def test_polling_readers_do_not_refresh(npusmi_poller):
+    libascend.ascendStartPolling(interval=10.0)
+    refreshes = len(npusmi_poller)
+    libascend._cache_ts = 0.0  # expired, but the poller owns the refresh
+    assert libascend.ascendDeviceGetTemperature(0) == 37
+    assert len(npusmi_poller) == refreshes
+
+
+def test_force_refresh(npusmi_poller):
+    libascend.ascendStartPolling(interval=10.0)
+    refreshes = len(npusmi_poller)
+    libascend.ascendForceRefresh()
+    assert wait_until(lambda: len(npusmi_poller) > refreshes)
+
+
+def test_set_refresh_interval(npusmi_poller):
+    libascend.ascendSetRefreshInterval(5)
+    assert libascend._CACHE_TTL == 5.0
+    libascend.ascendSetRefreshInterval(0.0)
+    assert libascend._CACHE_TTL == 0.1
+
+    libascend.ascendStartPolling(interval=10.0)
+    refreshes = len(npusmi_poller)
+    libascend.ascendSetRefreshInterval(0.1)  # wakes the poller, which picks up the new period
+    assert wait_until(lambda: len(npusmi_poller) >= refreshes + 3)
+
+
+def test_polling_drops_stale_data(npusmi_poller, monkeypatch):
+    libascend.ascendStartPolling(interval=0.1)
+    assert libascend.ascendDeviceGetTemperature(0) == 37
+
+    def failing_refresh_cache(raw=None):
+        raise subprocess.TimeoutExpired('npu-smi', 3)
+
+    monkeypatch.setattr(libascend, '_refresh_cache', failing_refresh_cache)
+    assert wait_until(lambda: libascend.ascendDeviceGetCount() == 0)
+    assert libascend.ascendDeviceGetTemperature(0) == libascend.NA
+    assert libascend.ascendDeviceGetMemoryInfo(0) == libascend.MemInfo(0, 0, 0)
+
+
+def test_device_get_all(npusmi_poller):
+    libascend._update_cache()
+    libascend._cache_ts = float('inf')
+
+    temp, power, util, mem = libascend.ascendDeviceGetAll(3)
+    assert temp == 38
+    assert power == libascend.NA + ' '
+    assert util == libascend.Util(npu=0, mem=16.1, bandwidth='N/A', aicpu='N/A')
+    assert mem == libascend.MemInfo(65536 << 20, (65536 - 10568) << 20, 10568 << 20)
+    assert libascend.ascendDeviceGetAll(4) == (libascend.NA, libascend.NA, libascend.NA, libascend.MemInfo(0, 0, 0))
+
+
+def test_device_get_bus_id(npusmi_poller):
+    libascend._update_cache()
+    libascend._cache_ts = float('inf')
+
+    assert libascend.ascendDeviceGetBusId(0) == '0000:9C:00.0'
+    assert libascend.ascendDeviceGetBusId(2) == '0000:37:00.0'
+    assert libascend.ascendDeviceGetBusId(4) == libascend.NA
+
+
+def test_read_version_file(tmp_path):
+    version_info = tmp_path / 'version.info'
+    version_info.write_text('Version=23.0.2.1\nascendhal_version=7.35.19\n', encoding='utf-8')
+    assert libascend._read_version_file(str(version_info), libascend._RE_DRIVER) == '23.0.2.1'
+
+    version_info.write_text('ascendhal_version=7.35.19\n', encoding='utf-8')
+    assert libascend._read_version_file(str(version_info), libascend._RE_DRIVER) is None
+    assert libascend._read_version_file(str(tmp_path / 'missing.info'), libascend._RE_DRIVER) is None
+
+
+def test_shutdown_does_not_wait_for_poller(npusmi_poller, monkeypatch):
+    libascend.ascendStartPolling(interval=0.1)
+    poller = libascend._POLLER
+    refreshing = threading.Event()
+
+    def slow_refresh_cache(raw=None):
+        refreshing.set()
+        time.sleep(2.0)  # an npu-smi call that is slow to return
+
+    monkeypatch.setattr(libascend, '_refresh_cache', slow_refresh_cache)
+    assert refreshing.wait(timeout=2.0)
+
+    start = time.monotonic()
+    libascend.ascendShutdown()
+    assert time.monotonic() - start < 0.5
+    assert libascend._POLLER is None
+    poller.join(timeout=5)
+    libascend.ascendInit()